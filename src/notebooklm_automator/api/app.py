@@ -4,7 +4,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from notebooklm_automator.api.routes import router, get_automator
+from notebooklm_automator.api.routes import router, get_automator, run_in_browser
 
 
 @asynccontextmanager
@@ -13,8 +13,8 @@ async def lifespan(app: FastAPI):
     yield
 
     try:
-        automator = get_automator()
-        automator.close()
+        automator = await get_automator()
+        await run_in_browser(automator.close)
     except Exception:
         pass
 
@@ -1,9 +1,16 @@
 """API routes for NotebookLM Automator."""
 
+import asyncio
+import functools
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
 from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 
 from notebooklm_automator.api.models import (
     AudioStatusResponse,
@@ -18,6 +25,7 @@ from notebooklm_automator.api.models import (
     UploadSourcesRequest,
     VideoStatusResponse,
 )
+from notebooklm_automator.config import get_settings
 from notebooklm_automator.core.automator import NotebookLMAutomator
 
 
@@ -25,19 +33,40 @@ router = APIRouter()
 
 _automator_instance: NotebookLMAutomator = None
 
+# The sync Playwright API is bound to the thread that started it, so every
+# automator call runs on this single worker. Endpoints await it instead of
+# each holding a threadpool thread for the length of the browser work.
+_browser_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="playwright"
+)
+
+
+async def run_in_browser(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking automator call on the browser thread and await it."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _browser_executor, functools.partial(func, *args, **kwargs)
+    )
+
 
-def get_automator() -> NotebookLMAutomator:
-    """Get or create the automator instance."""
+async def get_automator() -> NotebookLMAutomator:
+    """Get or create the automator instance (dependency)."""
+    return await run_in_browser(_get_or_create_automator)
+
+
+def _get_or_create_automator() -> NotebookLMAutomator:
+    """Get or create the automator instance; runs on the browser thread."""
     global _automator_instance
     if not _automator_instance:
-        url = os.getenv("NOTEBOOKLM_URL")
-        if not url:
+        settings = get_settings()
+        if not settings.notebook_url:
             raise HTTPException(
                 status_code=500,
                 detail="NOTEBOOKLM_URL environment variable not set",
             )
-        port = int(os.getenv("NOTEBOOKLM_CHROME_PORT", "9222"))
-        _automator_instance = NotebookLMAutomator(notebook_url=url, port=port)
+        _automator_instance = NotebookLMAutomator(
+            notebook_url=settings.notebook_url, port=settings.chrome_port
+        )
         try:
             _automator_instance.connect()
         except Exception as e:
@@ -48,9 +77,22 @@ def get_automator() -> NotebookLMAutomator:
     return _automator_instance
 
 
+def _remove_file(path: str) -> None:
+    """Delete a downloaded file once its response has been sent."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 @router.get("/debug/status")
-def debug_status(automator: NotebookLMAutomator = Depends(get_automator)):
+async def debug_status(automator: NotebookLMAutomator = Depends(get_automator)):
     """Debug endpoint to check current page status."""
+    return await run_in_browser(_debug_status, automator)
+
+
+def _debug_status(automator: NotebookLMAutomator) -> dict:
+    """Collect debug_status data; runs on the browser thread."""
     try:
         automator.ensure_connected()
         page = automator.page
@@ -143,7 +185,7 @@ def debug_status(automator: NotebookLMAutomator = Depends(get_automator)):
 
 
 @router.get("/debug/screenshot")
-def debug_screenshot(
+async def debug_screenshot(
     save: bool = False,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
@@ -152,6 +194,11 @@ def debug_screenshot(
     Args:
         save: If True, save to /app/local/cookies/screenshot.png (viewable on host)
     """
+    return await run_in_browser(_debug_screenshot, automator, save)
+
+
+def _debug_screenshot(automator: NotebookLMAutomator, save: bool):
+    """Take the debug_screenshot capture; runs on the browser thread."""
     try:
         automator.ensure_connected()
         screenshot = automator.page.screenshot(full_page=False)
@@ -174,8 +221,13 @@ def debug_screenshot(
 
 
 @router.get("/debug/studio-full")
-def debug_studio_full(automator: NotebookLMAutomator = Depends(get_automator)):
+async def debug_studio_full(automator: NotebookLMAutomator = Depends(get_automator)):
     """Dump the full Studio panel HTML including generation cards."""
+    return await run_in_browser(_debug_studio_full, automator)
+
+
+def _debug_studio_full(automator: NotebookLMAutomator) -> dict:
+    """Collect debug_studio_full data; runs on the browser thread."""
     try:
         automator.ensure_connected()
         page = automator.page
@@ -207,12 +259,19 @@ def debug_studio_full(automator: NotebookLMAutomator = Depends(get_automator)):
 
 
 @router.get("/debug/studio-video-html")
-def debug_studio_video_html(automator: NotebookLMAutomator = Depends(get_automator)):
+async def debug_studio_video_html(
+    automator: NotebookLMAutomator = Depends(get_automator),
+):
     """Dump Studio panel HTML to discover video selectors.
 
     Navigate to the Studio tab and return the full innerHTML so we can
     map the real CSS selectors for video generation.
     """
+    return await run_in_browser(_debug_studio_video_html, automator)
+
+
+def _debug_studio_video_html(automator: NotebookLMAutomator) -> dict:
+    """Collect debug_studio_video_html data; runs on the browser thread."""
     try:
         automator.ensure_connected()
         page = automator.page
@@ -248,13 +307,13 @@ def debug_studio_video_html(automator: NotebookLMAutomator = Depends(get_automat
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/sources/upload", response_model=UploadResponse)
-def upload_sources(
+async def upload_sources(
     request: UploadSourcesRequest,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
     """Upload one or more sources to the notebook."""
     sources_data = [s.model_dump() for s in request.sources]
-    results_data = automator.add_sources(sources_data)
+    results_data = await run_in_browser(automator.add_sources, sources_data)
 
     results = [SourceResult(**r) for r in results_data]
     overall_success = all(r.success for r in results)
@@ -262,9 +321,9 @@ def upload_sources(
 
 
 @router.post("/sources/clear", response_model=ClearSourcesResponse)
-def clear_sources(automator: NotebookLMAutomator = Depends(get_automator)):
+async def clear_sources(automator: NotebookLMAutomator = Depends(get_automator)):
     """Clear all sources from the notebook."""
-    result = automator.clear_sources()
+    result = await run_in_browser(automator.clear_sources)
     return ClearSourcesResponse(
         success=result.get("success", False),
         count=result.get("count", 0),
@@ -273,13 +332,14 @@ def clear_sources(automator: NotebookLMAutomator = Depends(get_automator)):
 
 
 @router.post("/audio/generate", response_model=GenerateAudioResponse)
-def generate_audio(
+async def generate_audio(
     request: GenerateAudioRequest,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
     """Trigger audio generation."""
     try:
-        job_id = automator.generate_audio(
+        job_id = await run_in_browser(
+            automator.generate_audio,
             style=request.style.value if request.style else None,
             language=request.language,
             prompt=request.prompt,
@@ -291,16 +351,16 @@ def generate_audio(
 
 
 @router.get("/audio/status/{job_id}", response_model=AudioStatusResponse)
-def check_audio_status(
+async def check_audio_status(
     job_id: str,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
     """Check the status of audio generation."""
-    status_data = automator.get_audio_status(job_id)
+    status_data = await run_in_browser(automator.get_audio_status, job_id)
 
     download_url = None
     if status_data["status"] == "completed":
-        download_url = automator.get_download_url(job_id)
+        download_url = await run_in_browser(automator.get_download_url, job_id)
 
     return AudioStatusResponse(
         job_id=job_id,
@@ -311,19 +371,19 @@ def check_audio_status(
 
 
 @router.get("/audio/file/{job_id}")
-def get_audio_download_url(
+async def get_audio_download_url(
     job_id: str,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
     """Return the direct download URL for generated audio."""
-    status_data = automator.get_audio_status(job_id)
+    status_data = await run_in_browser(automator.get_audio_status, job_id)
     if status_data["status"] != "completed":
         raise HTTPException(
             status_code=400,
             detail="Audio generation not completed or failed",
         )
 
-    url = automator.get_download_url(job_id)
+    url = await run_in_browser(automator.get_download_url, job_id)
     if not url:
         raise HTTPException(
             status_code=500,
@@ -334,20 +394,21 @@ def get_audio_download_url(
 
 
 @router.get("/audio/download/{job_id}")
-def download_audio_file(
+async def download_audio_file(
     job_id: str,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
     """Download audio file as binary data.
 
     Returns the actual audio file content as binary data.
-    In browserless mode, downloads via HTTP from the captured URL.
-    In CDP mode, uses filesystem-based download.
+    In browserless mode, downloads the captured URL through the browser
+    context (falling back to plain HTTP).
+    In CDP mode, uses filesystem-based download and streams the file.
     """
     import requests
     from urllib.parse import quote
 
-    status_data = automator.get_audio_status(job_id)
+    status_data = await run_in_browser(automator.get_audio_status, job_id)
 
     if status_data["status"] != "completed":
         raise HTTPException(
@@ -360,28 +421,33 @@ def download_audio_file(
 
     if ws_endpoint:
         # Browserless mode: download via HTTP from captured URL
-        url = automator.get_download_url(job_id)
+        url = await run_in_browser(automator.get_download_url, job_id)
         if not url:
             raise HTTPException(
                 status_code=500,
                 detail="Could not retrieve download URL",
             )
 
-        try:
-            resp = requests.get(url, timeout=120)
-            resp.raise_for_status()
-            content = resp.content
-            file_size = len(content)
-            # Extract filename from URL or use default
-            file_name = f"audio_{job_id}.mp4"
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to download audio from URL: {str(e)}",
-            )
+        # Prefer the browser's request context: it already holds the cookies
+        content = await run_in_browser(automator.fetch_audio, url)
+        if content is None:
+            try:
+                resp = await run_in_threadpool(requests.get, url, timeout=120)
+                resp.raise_for_status()
+                content = resp.content
+            except Exception as e:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Failed to download audio from URL: {str(e)}",
+                )
+
+        file_path = None
+        file_size = len(content)
+        # Extract filename from URL or use default
+        file_name = f"audio_{job_id}.mp4"
     else:
         # CDP mode: download by clicking Download button in UI
-        result = automator.download_audio_file(job_id)
+        result = await run_in_browser(automator.download_audio_file, job_id)
 
         if not result:
             raise HTTPException(
@@ -389,7 +455,7 @@ def download_audio_file(
                 detail="Failed to download audio file",
             )
 
-        content, file_name, file_size = result
+        file_path, file_name, file_size = result
 
     encoded_filename = quote(file_name, safe='')
 
@@ -399,6 +465,15 @@ def download_audio_file(
         f"filename*=UTF-8''{encoded_filename}"
     )
 
+    if file_path:
+        # Stream from disk rather than loading the whole file into memory
+        return FileResponse(
+            file_path,
+            media_type="audio/mp4",
+            headers={"Content-Disposition": content_disposition},
+            background=BackgroundTask(_remove_file, file_path),
+        )
+
     return Response(
         content=content,
         media_type="audio/mp4",
@@ -410,9 +485,9 @@ def download_audio_file(
 
 
 @router.post("/studio/clear", response_model=ClearStudioResponse)
-def clear_studio(automator: NotebookLMAutomator = Depends(get_automator)):
+async def clear_studio(automator: NotebookLMAutomator = Depends(get_automator)):
     """Delete all generated audio items."""
-    result = automator.clear_studio()
+    result = await run_in_browser(automator.clear_studio)
     return ClearStudioResponse(
         success=result.get("success", False),
         count=result.get("count", 0),
@@ -421,13 +496,14 @@ def clear_studio(automator: NotebookLMAutomator = Depends(get_automator)):
 
 
 @router.post("/video/generate", response_model=GenerateVideoResponse)
-def generate_video(
+async def generate_video(
     request: GenerateVideoRequest,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
     """Trigger video overview generation."""
     try:
-        job_id = automator.generate_video(
+        job_id = await run_in_browser(
+            automator.generate_video,
             language=request.language,
             prompt=request.prompt,
         )
@@ -437,12 +513,12 @@ def generate_video(
 
 
 @router.get("/video/status/{job_id}", response_model=VideoStatusResponse)
-def check_video_status(
+async def check_video_status(
     job_id: str,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
     """Check the status of a video generation job."""
-    status_data = automator.get_video_status(job_id)
+    status_data = await run_in_browser(automator.get_video_status, job_id)
     return VideoStatusResponse(
         job_id=job_id,
         status=status_data["status"],
@@ -451,53 +527,58 @@ def check_video_status(
 
 
 @router.get("/video/download/{job_id}")
-def download_video_file(
+async def download_video_file(
     job_id: str,
     automator: NotebookLMAutomator = Depends(get_automator),
 ):
     """Download the generated video as an MP4 binary."""
     from urllib.parse import quote
 
-    status_data = automator.get_video_status(job_id)
+    status_data = await run_in_browser(automator.get_video_status, job_id)
     if status_data["status"] != "completed":
         raise HTTPException(
             status_code=400,
             detail="Video generation not completed or failed",
         )
 
-    result = automator.download_video_file(job_id)
+    result = await run_in_browser(automator.download_video_file, job_id)
     if not result:
         raise HTTPException(
             status_code=500,
             detail="Failed to download video file",
         )
 
-    content, file_name, file_size = result
+    file_path, file_name, file_size = result
     encoded_filename = quote(file_name, safe="")
     content_disposition = (
         f'attachment; filename="{encoded_filename}"; '
         f"filename*=UTF-8''{encoded_filename}"
     )
 
-    return Response(
-        content=content,
+    # Stream from disk and delete the saved copy once sent
+    return FileResponse(
+        file_path,
         media_type="video/mp4",
-        headers={
-            "Content-Disposition": content_disposition,
-            "Content-Length": str(file_size),
-        },
+        headers={"Content-Disposition": content_disposition},
+        background=BackgroundTask(_remove_file, file_path),
     )
 
 
 @router.post("/page/refresh")
-def refresh_page(automator: NotebookLMAutomator = Depends(get_automator)):
+async def refresh_page(automator: NotebookLMAutomator = Depends(get_automator)):
     """Refresh the current page to get latest status.
 
     Useful when the page state might be stale (e.g., after system sleep).
     """
+    return await run_in_browser(_refresh_page, automator)
+
+
+def _refresh_page(automator: NotebookLMAutomator) -> dict:
+    """Reload the notebook page; runs on the browser thread."""
     try:
         automator.ensure_connected()
         automator.page.reload(wait_until="domcontentloaded", timeout=30000)
+        automator.invalidate_studio_tab()
         # Wait for page to stabilize
         automator.page.wait_for_timeout(2000)
         return {"success": True, "message": "Page refreshed"}
@@ -506,7 +587,7 @@ def refresh_page(automator: NotebookLMAutomator = Depends(get_automator)):
 
 
 @router.post("/auth/save")
-def save_login_state(automator: NotebookLMAutomator = Depends(get_automator)):
+async def save_login_state(automator: NotebookLMAutomator = Depends(get_automator)):
     """Save current browser login state to storage_state.json.
 
     This captures cookies and localStorage from the current browser session.
@@ -521,8 +602,8 @@ def save_login_state(automator: NotebookLMAutomator = Depends(get_automator)):
     3. Future sessions will use storage_state.json automatically
     """
     try:
-        automator.ensure_connected()
-        success = automator.save_login_state()
+        await run_in_browser(automator.ensure_connected)
+        success = await run_in_browser(automator.save_login_state)
 
         if success:
             return {
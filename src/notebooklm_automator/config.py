@@ -0,0 +1,35 @@
+"""Process-wide settings for NotebookLM Automator."""
+
+import functools
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Server settings resolved from the environment (and .env)."""
+
+    notebook_url: Optional[str]
+    headless: bool
+    cookies_file: Optional[str]
+    chrome_port: int
+    download_dir: str
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load .env and read settings once per process.
+
+    CLI overrides must be written to os.environ before the first call.
+    """
+    load_dotenv()
+    return Settings(
+        notebook_url=os.getenv("NOTEBOOKLM_URL") or None,
+        headless=os.getenv("NOTEBOOKLM_HEADLESS", "0").lower() in {"1", "true", "yes"},
+        cookies_file=os.getenv("NOTEBOOKLM_COOKIES_FILE") or None,
+        chrome_port=int(os.getenv("NOTEBOOKLM_CHROME_PORT", "9222")),
+        download_dir=os.getenv("DOWNLOAD_DIR", "/tmp/shared-downloads"),
+    )
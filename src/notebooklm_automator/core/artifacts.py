@@ -0,0 +1,352 @@
+"""Shared Studio artifact helpers for NotebookLM Automator."""
+
+import functools
+import logging
+import os
+import tempfile
+import time
+from typing import Dict, Optional, TYPE_CHECKING
+
+from playwright.sync_api import expect
+
+from notebooklm_automator.config import get_settings
+from notebooklm_automator.core.selectors import get_selector_by_language
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Download, Locator, Page
+
+logger = logging.getLogger(__name__)
+
+# Localized UI strings, memoized per (locale, key)
+_localized_text = functools.lru_cache(maxsize=256)(get_selector_by_language)
+
+# Title candidates inside an artifact item, in priority order. A bare
+# .artifact-title already covers the span/.artifact-labels variants.
+_TITLE_SELECTORS = (
+    ".artifact-title",
+    ".artifact-labels div span",
+    "span.mat-title-small",
+)
+
+# Returns an item's rendered title node (first non-empty candidate) or null
+_FIND_TITLE_NODE_JS = """(el, titleSelectors) => {
+    for (const selector of titleSelectors) {
+        const node = el.querySelector(selector);
+        if (node && node.getClientRects().length && node.innerText.trim()) return node;
+    }
+    return null;
+}"""
+
+# Classifies an artifact-library item in the page so only the status string
+# crosses CDP. Icons are matched by ligature name; localized sentinels
+# (already lowercased) are matched against the item's status labels, i.e.
+# its rendered text outside the title and icons, so a title such as
+# "Generating power from ..." cannot change the status.
+_ITEM_STATUS_JS = """(el, [generating, error, titleSelectors]) => {
+    const findTitle = """ + _FIND_TITLE_NODE_JS + """;
+    const icons = Array.from(el.querySelectorAll("mat-icon"), (i) => i.textContent.trim());
+    const titleNode = findTitle(el, titleSelectors);
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    let labels = "";
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+        const parent = node.parentElement;
+        if (!parent || parent.closest("mat-icon") || !parent.getClientRects().length) continue;
+        if (titleNode && titleNode.contains(node)) continue;
+        labels += " " + node.textContent;
+    }
+    labels = labels.toLowerCase();
+    if (icons.includes("sync") || labels.includes(generating)) return "generating";
+    if (icons.includes("play_arrow")) return "completed";
+    if (icons.includes("error") || labels.includes(error)) return "failed";
+    return "unknown";
+}"""
+
+# Resolves an item's status and title in a single round trip over the
+# artifact-library children. Returns only the child count when the index is
+# out of range.
+_SCAN_ARTIFACT_JS = """(items, [index, generating, error, titleSelectors]) => {
+    const classify = """ + _ITEM_STATUS_JS + """;
+    const findTitle = """ + _FIND_TITLE_NODE_JS + """;
+    const el = items[index];
+    if (!el) return {count: items.length};
+    const titleNode = findTitle(el, titleSelectors);
+    const title = titleNode ? titleNode.innerText.trim() : null;
+    return {
+        count: items.length,
+        status: classify(el, [generating, error, titleSelectors]),
+        title,
+    };
+}"""
+
+
+class ArtifactManagerBase:
+    """Base class for managers that work on Studio artifact-library items.
+
+    Owns the page, the per-locale selectors, the artifact-library locators
+    and the status detection shared by AudioManager and VideoManager.
+    Job IDs are 1-based indices into the artifact-library children.
+    """
+
+    def __init__(self, page: "Page", locale: str = "en"):
+        self.page = page
+        self._artifact_library = self.page.locator("artifact-library")
+        self._artifact_items = self._artifact_library.locator(":scope > *")
+        # Localized selectors per UI language, built on first use of each
+        self._locale = locale
+        self._sel_cache: Dict[str, Dict[str, str]] = {}
+        self._refresh_i18n()
+        # Monotonic time of the last positive Studio tab check; trusted for
+        # _studio_tab_ttl seconds so polling skips the probe
+        self._studio_tab_verified_at = 0.0
+        self._studio_tab_ttl = 2.0
+        # Where finished downloads are saved (DOWNLOAD_DIR)
+        self._download_dir = get_settings().download_dir
+
+    def set_locale(self, locale: str) -> None:
+        """Switch to the selectors of another UI language.
+
+        Selectors for a locale are built once and reused on later switches.
+        """
+        if locale == self._locale:
+            return
+        self._locale = locale
+        self._refresh_i18n()
+
+    def _get_text(self, key: str) -> str:
+        """Get localized text for a selector key in the current locale."""
+        return _localized_text(self._locale, key)
+
+    def _refresh_i18n(self) -> None:
+        """Point self._sel at the current locale's selectors."""
+        sel = self._sel_cache.get(self._locale)
+        if sel is None:
+            sel = self._sel_cache[self._locale] = self._build_selectors()
+        self._sel = sel
+
+    def _build_selectors(self) -> Dict[str, str]:
+        """Return this manager's localized selectors; subclasses extend it."""
+        studio_text = self._get_text("studio_tab")
+        more_label = self._get_text("more_button")
+        return {
+            # Lowercased status markers passed to the in-page status check
+            "generating_status": self._get_text("generating_status_text").lower(),
+            "error_status": self._get_text("error_text").lower(),
+            "studio_tab_text": studio_text,
+            # MDC (.mat-mdc-tab) and legacy (.mat-tab-label) tabs both carry
+            # role="tab", so a single branch matches either
+            "studio_tab": f"[role='tab']:has-text('{studio_text}')",
+            "more_button_label": more_label,
+            "more_button": f"button[aria-label='{more_label}']",
+            "download_menu_item": self._get_text("download_menu_item"),
+            "generate_button": (
+                "mat-dialog-actions button:has-text"
+                f"('{self._get_text('generate_button')}')"
+            ),
+        }
+
+    def get_status(self, job_id: str) -> Dict[str, str]:
+        """Check generation status for a job.
+
+        Args:
+            job_id: 1-based index string returned by generate().
+
+        Returns:
+            Dict with 'status' (generating|completed|failed|unknown) and optional 'title'.
+        """
+        self._ensure_studio_tab()
+
+        try:
+            index = int(job_id) - 1
+        except ValueError:
+            return {"status": "unknown", "error": "Invalid job_id format"}
+
+        try:
+            scan = self._artifact_items.evaluate_all(
+                _SCAN_ARTIFACT_JS,
+                [
+                    index,
+                    self._sel["generating_status"],
+                    self._sel["error_status"],
+                    list(_TITLE_SELECTORS),
+                ],
+            )
+        except Exception as e:
+            logger.debug("Artifact scan failed, using locators: %s", e)
+            return self._get_status_via_locators(index)
+
+        if "status" not in scan:
+            return {"status": "unknown", "error": "Job ID not found"}
+
+        return {"status": scan["status"], "title": scan["title"]}
+
+    def _get_status_via_locators(self, index: int) -> Dict[str, str]:
+        """Locator-based get_status fallback (several round trips)."""
+        count = self._artifact_items.count()
+
+        if count <= index:
+            return {"status": "unknown", "error": "Job ID not found"}
+
+        item = self._artifact_items.nth(index)
+        title = self._get_item_title(item)
+        return {"status": self._item_status(item), "title": title}
+
+    def _resolve_item(self, job_id: str) -> Optional["Locator"]:
+        """Return the artifact item for a job_id, or None if it does not exist."""
+        try:
+            index = int(job_id) - 1
+        except ValueError:
+            logger.error("Invalid job_id: %s", job_id)
+            return None
+
+        count = self._artifact_items.count()
+        if index < 0 or index >= count:
+            logger.error("Job %s not found (count=%d)", job_id, count)
+            return None
+
+        return self._artifact_items.nth(index)
+
+    def _click_generate(self, generate_btn: "Locator") -> int:
+        """Click a dialog's Generate button and wait for the new artifact.
+
+        Returns:
+            The artifact-library item count afterwards, i.e. the 1-based
+            index of the new item.
+        """
+        initial_count = self._artifact_items.count()
+        # The Studio panel re-renders once generation starts
+        self.invalidate_studio_tab()
+        generate_btn.click()
+
+        try:
+            self.page.wait_for_selector(
+                "mat-dialog-container", state="hidden", timeout=5000
+            )
+        except Exception:
+            pass
+
+        # Wait for the new artifact instead of sleeping a fixed interval
+        if not self._wait_for_item_count_change(initial_count, timeout=15000):
+            logger.warning("No new artifact appeared after clicking generate")
+
+        return self._artifact_items.count()
+
+    def _wait_for_item_count_change(self, count: int, timeout: float) -> bool:
+        """Wait until the artifact-library child count differs from count."""
+        try:
+            expect(self._artifact_items).not_to_have_count(count, timeout=timeout)
+            return True
+        except AssertionError:
+            return False
+
+    def _save_download(
+        self, download: "Download", file_name: str, prefix: str
+    ) -> str:
+        """Save a finished download under a unique name and drop Playwright's copy."""
+        os.makedirs(self._download_dir, exist_ok=True)
+        fd, target = tempfile.mkstemp(
+            prefix=prefix, suffix=os.path.splitext(file_name)[1] or ".mp4",
+            dir=self._download_dir,
+        )
+        os.close(fd)
+        try:
+            download.save_as(target)
+        except Exception:
+            os.remove(target)
+            raise
+        try:
+            download.delete()
+        except Exception:
+            pass
+        return target
+
+    def _scroll_into_view(self, item: "Locator") -> None:
+        """Scroll an artifact item into the viewport (no-op if already there)."""
+        try:
+            item.scroll_into_view_if_needed(timeout=500)
+        except Exception:
+            pass
+
+    def _item_status(self, item: "Locator") -> str:
+        """Classify an artifact item as generating/completed/failed/unknown."""
+        return item.evaluate(
+            _ITEM_STATUS_JS,
+            [
+                self._sel["generating_status"],
+                self._sel["error_status"],
+                list(_TITLE_SELECTORS),
+            ],
+        )
+
+    def _close_any_dialog(self) -> None:
+        """Close any open dialog that might block tab clicks."""
+        try:
+            # Check for open mat-dialog-container
+            dialog = self.page.locator("mat-dialog-container").last
+            if dialog.is_visible():
+                # Try close button first
+                close_btn = self.page.locator(
+                    "button:has(mat-icon:has-text('close'))"
+                ).first
+                if close_btn.is_visible():
+                    close_btn.click()
+                else:
+                    # Fallback: press Escape
+                    self.page.keyboard.press("Escape")
+                # Returns as soon as the close animation finishes
+                dialog.wait_for(state="hidden", timeout=2000)
+        except Exception:
+            pass
+
+    def _ensure_studio_tab(self) -> None:
+        """Switch to Studio tab if artifact-library is not visible (tab mode)."""
+        if time.monotonic() - self._studio_tab_verified_at < self._studio_tab_ttl:
+            return  # Verified moments ago
+
+        if self._artifact_library.count() > 0:
+            self._studio_tab_verified_at = time.monotonic()
+            return  # Already in full layout or Studio tab
+
+        # Close any open dialog that might block tab clicks
+        self._close_any_dialog()
+
+        # Priority 1: Angular Material tab with the Studio label
+        studio_tab = self.page.locator(self._sel["studio_tab"]).first
+        if studio_tab.is_visible():
+            logger.info("Switching to Studio tab...")
+            studio_tab.click()
+            self._wait_for_artifact_library()
+            return
+
+        # Priority 2: fallback to text matching
+        studio_tab = self.page.get_by_text(
+            self._sel["studio_tab_text"], exact=True
+        ).first
+        if studio_tab.is_visible():
+            logger.info("Switching to Studio tab (text match)...")
+            studio_tab.click()
+            self._wait_for_artifact_library()
+
+    def _wait_for_artifact_library(self) -> None:
+        """Wait for the Studio panel to render after a tab switch."""
+        try:
+            self._artifact_library.first.wait_for(state="attached", timeout=3000)
+        except Exception:
+            logger.debug("artifact-library did not appear after tab switch")
+
+    def invalidate_studio_tab(self) -> None:
+        """Force the next _ensure_studio_tab() to re-check the page."""
+        self._studio_tab_verified_at = 0.0
+
+    def _get_item_title(self, item: "Locator") -> Optional[str]:
+        """Extract title from an artifact-library-item element."""
+        try:
+            # Try multiple selectors for maximum compatibility
+            for selector in _TITLE_SELECTORS:
+                title_el = item.locator(selector).first
+                if title_el.is_visible():
+                    title = title_el.inner_text().strip()
+                    if title:
+                        return title
+            return None
+        except Exception:
+            return None
@@ -1,72 +1,56 @@
 """Audio generation and retrieval operations for NotebookLM Automator."""
 
 import logging
-import time
-from typing import Any, Callable, Dict, Optional, Tuple, TYPE_CHECKING
+import os
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+
+from notebooklm_automator.core.artifacts import ArtifactManagerBase
 
 if TYPE_CHECKING:
-    from playwright.sync_api import Page
+    from playwright.sync_api import Route
 
 logger = logging.getLogger(__name__)
 
+# Lowercased body prefixes that mark an HTML/XML/JSON error page, not media
+_ERROR_BODY_PREFIXES = (b"<!doctype", b"<html", b"<?xml", b"{")
 
-class AudioManager:
-    """Manages audio generation and retrieval for a NotebookLM page."""
 
-    def __init__(self, page: "Page", get_text: Callable[[str], str]):
-        self.page = page
-        self._get_text = get_text
+def _is_error_body(body: bytes) -> bool:
+    """Return True if a response body looks like an error page."""
+    head = body[:64].lstrip()
+    return head[:9].lower().startswith(_ERROR_BODY_PREFIXES)
 
-    def _close_any_dialog(self) -> None:
-        """Close any open dialog that might block tab clicks."""
-        try:
-            # Check for open mat-dialog-container
-            dialog = self.page.locator("mat-dialog-container").last
-            if dialog.count() > 0 and dialog.is_visible():
-                # Try close button first
-                close_btn = self.page.locator(
-                    "button:has(mat-icon:has-text('close'))"
-                ).first
-                if close_btn.count() > 0 and close_btn.is_visible():
-                    close_btn.click()
-                    self.page.wait_for_timeout(200)
-                    return
-
-                # Fallback: press Escape
-                self.page.keyboard.press("Escape")
-                self.page.wait_for_timeout(200)
-        except Exception:
-            pass
 
-    def _ensure_studio_tab(self) -> None:
-        """Switch to Studio tab if artifact-library is not visible (tab mode)."""
-        parent = self.page.locator("artifact-library")
-        if parent.count() > 0:
-            return  # Already in full layout or Studio tab
-
-        # Close any open dialog that might block tab clicks
-        self._close_any_dialog()
-
-        # Try to click Studio tab using Angular Material tab selector
-        studio_text = self._get_text("studio_tab")
-        # Priority 1: mat-tab-label with text (Angular Material tabs)
-        studio_tab = self.page.locator(
-            f".mat-mdc-tab:has-text('{studio_text}'), "
-            f".mat-tab-label:has-text('{studio_text}'), "
-            f"[role='tab']:has-text('{studio_text}')"
-        ).first
-        if studio_tab.count() > 0 and studio_tab.is_visible():
-            logger.info("Switching to Studio tab...")
-            studio_tab.click()
-            self.page.wait_for_timeout(500)
-            return
-
-        # Priority 2: fallback to text matching
-        studio_tab = self.page.get_by_text(studio_text, exact=True).first
-        if studio_tab.count() > 0 and studio_tab.is_visible():
-            logger.info("Switching to Studio tab (text match)...")
-            studio_tab.click()
-            self.page.wait_for_timeout(500)
+def _abort_media(route: "Route") -> None:
+    """Abort the player's media fetch, letting every other request through."""
+    if route.request.resource_type == "media":
+        route.abort()
+    else:
+        route.continue_()
+
+
+class AudioManager(ArtifactManagerBase):
+    """Manages audio generation and retrieval for a NotebookLM page."""
+
+    def _build_selectors(self) -> Dict[str, str]:
+        """Add the audio player and delete-flow selectors."""
+        sel = super()._build_selectors()
+        sel.update({
+            "play_button": (
+                f"button[aria-label='{self._get_text('play_arrow_button')}']"
+            ),
+            "close_player_button": (
+                "button[aria-label="
+                f"'{self._get_text('close_audio_player_button')}']"
+            ),
+            "prompt_textarea": (
+                "textarea[placeholder*="
+                f"'{self._get_text('prompt_textarea_placeholder')}']"
+            ),
+            "delete_menu_item": self._get_text("delete_menu_item"),
+            "confirm_delete_button": self._get_text("confirm_delete_button"),
+        })
+        return sel
 
     def generate(
         self,
@@ -78,21 +62,21 @@ class AudioManager:
         """Generate an audio overview and return a job ID."""
         self._ensure_studio_tab()
 
+        # Prefer the icon itself; or_() would pick its wrapping button first
         edit_icon = self.page.locator(
             "mat-icon:has-text('edit'), mat-icon.edit-button-icon"
         ).first
-        if not edit_icon.is_visible():
+        if edit_icon.is_visible():
+            edit_icon.click(force=True)
+        else:
             edit_btn = self.page.locator(
                 "button:has(mat-icon:has-text('edit'))"
             ).first
-            if edit_btn.is_visible():
-                edit_btn.click()
-            else:
+            if not edit_btn.is_visible():
                 raise RuntimeError(
                     "Could not find Edit/Pencil icon for Audio Overview"
                 )
-        else:
-            edit_icon.click(force=True)
+            edit_btn.click()
 
         self.page.wait_for_selector("mat-dialog-container", state="visible")
 
@@ -101,7 +85,7 @@ class AudioManager:
             style_button = self.page.locator(
                 f"mat-radio-button:has-text('{style_text}')"
             )
-            if style_button.count() > 0 and style_button.is_visible():
+            if style_button.is_visible():
                 style_button.click()
             else:
                 raise RuntimeError(
@@ -128,16 +112,13 @@ class AudioManager:
                 duration_button = self.page.locator(
                     f"mat-button-toggle:has-text('{duration_text}')"
                 )
-                if duration_button.count() > 0 and duration_button.is_visible():
+                if duration_button.is_visible():
                     duration_button.click()
                 else:
-                    logger.warning(f"Could not find duration button: {duration}")
+                    logger.warning("Could not find duration button: %s", duration)
 
         if prompt:
-            placeholder_snippet = self._get_text("prompt_textarea_placeholder")
-            textarea = self.page.locator(
-                f"textarea[placeholder*='{placeholder_snippet}']"
-            )
+            textarea = self.page.locator(self._sel["prompt_textarea"])
 
             if not textarea.is_visible():
                 textarea = self.page.locator(
@@ -146,250 +127,125 @@ class AudioManager:
             if textarea.is_visible():
                 textarea.fill(prompt)
 
-        generate_btn = self.page.locator(
-            f"mat-dialog-actions button:has-text('{self._get_text('generate_button')}')"
-        ).last
+        generate_btn = self.page.locator(self._sel["generate_button"]).last
         if not generate_btn.is_visible():
             generate_btn = self.page.locator("mat-dialog-actions button").last
 
-        generate_btn.click()
-
-        try:
-            self.page.wait_for_selector(
-                "mat-dialog-container", state="hidden", timeout=5000
-            )
-        except Exception:
-            pass
-
-        time.sleep(2)
-
-        items = self.page.locator(".artifact-library-container")
-        count = items.count()
-
+        # Job ID = new item count (1-based index of the newly added item)
+        count = self._click_generate(generate_btn)
         return str(count)
 
-    def _reset_download_behavior(self):
-        """Reset Chrome's download behavior to normal."""
-        try:
-            # Remove any active route handlers
-            self.page.unroute("**/*")
-        except Exception:
-            pass
-
-        try:
-            # Reset download behavior via CDP
-            cdp = self.page.context.new_cdp_session(self.page)
-            cdp.send("Browser.setDownloadBehavior", {
-                "behavior": "allow",
-                "downloadPath": "/tmp/shared-downloads"
-            })
-        except Exception:
-            pass
-
-    def _get_item_title(self, item) -> Optional[str]:
-        """Extract title from an artifact-library-item element."""
-        try:
-            # Try multiple selectors for maximum compatibility
-            title_selectors = [
-                ".artifact-title",
-                "span.artifact-title",
-                ".artifact-labels .artifact-title",
-                ".artifact-labels div span",
-                "span.mat-title-small",
-            ]
-            for selector in title_selectors:
-                title_el = item.locator(selector).first
-                if title_el.count() > 0 and title_el.is_visible():
-                    title = title_el.inner_text().strip()
-                    if title:
-                        return title
-            return None
-        except Exception:
-            return None
-
-    def get_status(self, job_id: str) -> Dict[str, str]:
-        """Check the status of an audio generation job."""
-        self._ensure_studio_tab()
-
-        try:
-            index = int(job_id) - 1
-        except ValueError:
-            return {"status": "unknown", "error": "Invalid job_id format"}
-
-        parent = self.page.locator("artifact-library")
-        children = parent.locator(":scope > *")
-        count = children.count()
-
-        if count <= index:
-            return {"status": "unknown", "error": "Job ID not found"}
-
-        item = children.nth(index)
-        text_content = item.inner_text()
-
-        # Extract title
-        title = self._get_item_title(item)
-
-        generating_text = self._get_text("generating_status_text")
-        if "sync" in text_content or generating_text in text_content:
-            return {"status": "generating", "title": title}
-
-        if "play_arrow" in text_content or item.locator(
-            "mat-icon:has-text('play_arrow')"
-        ).is_visible():
-            return {"status": "completed", "title": title}
-
-        error_text = self._get_text("error_text")
-        if "error" in text_content.lower() or error_text in text_content.lower():
-            return {"status": "failed", "title": title}
-
-        return {"status": "unknown", "title": title}
-
     def get_download_url(self, job_id: str) -> Optional[str]:
         """Get the direct file URL for generated audio."""
         self._ensure_studio_tab()
 
-        try:
-            index = int(job_id) - 1
-        except ValueError:
-            logger.error("Invalid job_id format: %s", job_id)
+        item = self._resolve_item(job_id)
+        if item is None:
             return None
 
-        parent = self.page.locator("artifact-library")
-        items = parent.locator(":scope > *")
-        count = items.count()
+        self._scroll_into_view(item)
 
-        if index < 0 or index >= count:
-            logger.error("Job ID %s not found (items=%s)", job_id, count)
-            return None
+        play_btn = item.locator(self._sel["play_button"]).first
 
-        item = items.nth(index)
+        # Settle the button first so only the click falls inside the capture
+        # window below
         try:
-            item.scroll_into_view_if_needed(timeout=2000)
+            play_btn.wait_for(state="visible", timeout=1000)
         except Exception:
-            pass
-
-        play_btn = item.locator(
-            f"button[aria-label='{self._get_text('play_arrow_button')}']"
-        ).first
-
-        if not play_btn.is_visible():
             logger.error("Play button not found for job %s", job_id)
             return None
 
+        # Resolves as soon as the player requests its media, no polling needed.
+        # The media request itself is aborted so each poll doesn't make the
+        # player stream the whole file; only the URL is wanted here.
+        self.page.route("**/*", _abort_media)
         try:
-            play_btn.wait_for(state="visible", timeout=1000)
-        except Exception:
-            pass
-
-        captured_url: Dict[str, Optional[str]] = {"value": None}
-
-        def route_handler(route, request):
-            try:
-                if captured_url["value"] is None and request.resource_type == "media":
-                    captured_url["value"] = request.url
-                    route.abort("blockedbyclient")
-                    return
-            except Exception:
-                pass
-
+            with self.page.expect_request(
+                lambda request: request.resource_type == "media", timeout=5000
+            ) as request_info:
+                play_btn.click()
+            media_url = request_info.value.url
+        except Exception as e:
+            logger.error("Failed to capture media URL for job %s: %s", job_id, e)
+            return None
+        finally:
             try:
-                route.continue_()
+                self.page.unroute("**/*", _abort_media)
             except Exception:
                 pass
 
-        pattern = "**/*"
-
         try:
-            self.page.route(pattern, route_handler)
+            close_player_button = self.page.locator(
+                self._sel["close_player_button"]
+            )
+            if close_player_button.is_visible():
+                close_player_button.first.click()
+        except Exception:
+            pass
 
-            try:
-                play_btn.click()
-            except Exception as click_error:
-                logger.error(
-                    "Failed to click play for job %s: %s", job_id, click_error
-                )
-                return None
+        return media_url
 
-            timeout_seconds = 5
-            start_time = time.time()
-            while (
-                captured_url["value"] is None
-                and (time.time() - start_time) < timeout_seconds
-            ):
-                self.page.wait_for_timeout(100)
-        finally:
-            try:
-                self.page.unroute(pattern, route_handler)
-            except Exception:
-                pass
+    def fetch_media(self, url: str) -> Optional[bytes]:
+        """Fetch a captured media URL through the browser context.
 
+        Uses the page's APIRequestContext, which shares the browser's cookie
+        jar, so no cookies have to be exported to a separate HTTP client.
+        """
         try:
-            if captured_url["value"]:
-                close_player_button = self.page.locator(
-                    f"button[aria-label='{self._get_text('close_audio_player_button')}']"
-                )
-                if close_player_button.is_visible():
-                    close_player_button.first.click()
-                return captured_url["value"]
+            response = self.page.context.request.get(
+                url, timeout=180_000, headers={"Accept": "*/*"}
+            )
+        except Exception as e:
+            logger.error("Media request failed: %s", e)
+            return None
 
-            logger.error("Failed to capture media URL for job %s", job_id)
+        if not response.ok:
+            logger.error("Media request returned HTTP %s", response.status)
             return None
-        except Exception:
+
+        body = response.body()
+        if len(body) < 1000 or _is_error_body(body):
+            logger.error("Media response is not audio (%d bytes)", len(body))
             return None
 
-    def download_file(self, job_id: str) -> Optional[Tuple[bytes, str, int]]:
-        """Download audio by clicking download and waiting for file.
+        return body
+
+    def download_file(self, job_id: str) -> Optional[Tuple[str, str, int]]:
+        """Download audio by clicking More → Download.
+
+        Waits for Playwright's download event, which fires once the file is
+        complete, and saves it into the download directory. The caller is
+        responsible for deleting the returned file once consumed.
 
         Returns:
-            Tuple of (file_content, file_name, file_size) or None if failed.
+            Tuple of (file_path, file_name, file_size) or None if failed.
         """
-        import os
-
         self._ensure_studio_tab()
 
         try:
-            index = int(job_id) - 1
-        except ValueError:
-            logger.error("Invalid job_id: %s", job_id)
-            return None
-
-        download_dir = os.environ.get("DOWNLOAD_DIR", "/tmp/shared-downloads")
-
-        # Get files BEFORE download
-        try:
-            files_before = set(os.listdir(download_dir))
-        except Exception:
-            files_before = set()
-
-        try:
-            parent = self.page.locator("artifact-library")
-            items = parent.locator(":scope > *")
-            count = items.count()
-
-            if index < 0 or index >= count:
-                logger.error("Job %s not found (count=%d)", job_id, count)
+            item = self._resolve_item(job_id)
+            if item is None:
                 return None
 
-            item = items.nth(index)
-            try:
-                item.scroll_into_view_if_needed(timeout=2000)
-            except Exception:
-                pass
+            self._scroll_into_view(item)
 
-            more_btn = item.locator(
-                f"button[aria-label='{self._get_text('more_button')}']"
-            ).first
+            more_btn = item.locator(self._sel["more_button"]).first
 
             if not more_btn.is_visible():
                 logger.error("More button not found")
                 return None
 
             more_btn.click()
-            self.page.wait_for_timeout(500)
+            self.invalidate_studio_tab()
 
-            download_text = self._get_text("download_menu_item")
             download_menu = self.page.get_by_role(
-                "menuitem", name=download_text).first
+                "menuitem", name=self._sel["download_menu_item"]).first
+
+            # Wait for the menu to open rather than sleeping a fixed interval
+            try:
+                download_menu.wait_for(state="visible", timeout=3000)
+            except Exception:
+                pass
 
             if not download_menu.is_visible():
                 logger.error("Download menu not found")
@@ -397,63 +253,21 @@ class AudioManager:
                 return None
 
             logger.info("Clicking Download...")
-            # Just click - don't use expect_download!
-            self._reset_download_behavior()
-            download_menu.click()
-
-            # Wait for NEW file to appear in download folder
-            logger.info("Waiting for file in %s...", download_dir)
-            timeout = 120
-            start_time = time.time()
-            downloaded_file = None
-
-            while time.time() - start_time < timeout:
-                try:
-                    files_now = set(os.listdir(download_dir))
-                    new_files = files_now - files_before
-
-                    for f in new_files:
-                        if f.endswith(".crdownload") or f.startswith("."):
-                            continue
-                        filepath = os.path.join(download_dir, f)
-                        if os.path.isfile(filepath) and os.path.getsize(filepath) > 0:
-                            downloaded_file = filepath
-                            logger.info("Found new file: %s", f)
-                            break
-                except Exception as e:
-                    logger.debug("Error listing dir: %s", e)
-
-                if downloaded_file:
-                    time.sleep(1)  # Ensure write complete
-                    break
-                time.sleep(0.5)
-
-            if not downloaded_file:
-                logger.error("Download timed out. Files before: %s, Files now: %s",
-                             files_before, files_now if 'files_now' in dir() else 'unknown')
-                return None
+            # expect_download resolves only once Chromium has finished writing
+            with self.page.expect_download(timeout=120_000) as download_info:
+                download_menu.click()
+            download = download_info.value
 
-            # Read the file
-            with open(downloaded_file, "rb") as f:
-                body = f.read()
-                file_name = os.path.basename(downloaded_file)
-                file_size = os.path.getsize(downloaded_file)
+            file_name = download.suggested_filename or f"audio_{job_id}.mp4"
+            file_path = self._save_download(download, file_name, prefix="audio_")
+            file_size = os.path.getsize(file_path)
 
-            logger.info("Downloaded %d bytes from %s",
-                        len(body), downloaded_file)
-
-            # Cleanup - delete only the file we downloaded
-            try:
-                os.remove(downloaded_file)
-            except Exception:
-                pass
+            logger.info("Downloaded %d bytes to %s", file_size, file_path)
 
-            return body, file_name, file_size
+            return file_path, file_name, file_size
 
         except Exception as e:
             logger.error("Download failed: %s", e)
-            import traceback
-            traceback.print_exc()
             return None
 
     def clear_studio(self) -> Dict[str, Any]:
@@ -461,28 +275,25 @@ class AudioManager:
         self._ensure_studio_tab()
 
         removed = 0
-        parent = self.page.locator("artifact-library")
-        if parent.count() == 0:
+        if self._artifact_library.count() == 0:
             return {"success": False, "count": 0, "message": "No generated items found"}
 
+        more_selector = self._sel["more_button"]
+        delete_label = self._sel["delete_menu_item"]
+        confirm_label = self._sel["confirm_delete_button"]
+
         max_attempts = 200
         for _ in range(max_attempts):
-            items = parent.locator(":scope > *")
-            count = items.count()
+            count = self._artifact_items.count()
             if count == 0:
                 break
 
-            item = items.first
-            try:
-                item.scroll_into_view_if_needed(timeout=2000)
-            except Exception:
-                pass
+            item = self._artifact_items.first
+            self._scroll_into_view(item)
 
-            more_btn = item.locator(
-                f"button[aria-label='{self._get_text('more_button')}']"
-            ).first
+            more_btn = item.locator(more_selector).first
 
-            if more_btn.count() == 0 or not more_btn.is_visible():
+            if not more_btn.is_visible():
                 logger.warning(
                     "Could not locate more options for generated item.")
                 break
@@ -490,14 +301,14 @@ class AudioManager:
             try:
                 more_btn.click()
             except Exception as e:
-                logger.error(f"Failed to open menu for generated item: {e}")
+                logger.error("Failed to open menu for generated item: %s", e)
                 break
 
             delete_menu = self.page.get_by_role(
-                "menuitem", name=self._get_text("delete_menu_item")
+                "menuitem", name=delete_label
             ).first
 
-            if delete_menu.count() == 0 or not delete_menu.is_visible():
+            if not delete_menu.is_visible():
                 logger.warning(
                     "Delete option not found in generated item menu.")
                 break
@@ -505,20 +316,23 @@ class AudioManager:
             delete_menu.click()
 
             confirm_button = self.page.get_by_role(
-                "button", name=self._get_text("confirm_delete_button")
+                "button", name=confirm_label
             ).first
 
-            if confirm_button.count() == 0 or not confirm_button.is_visible():
+            if not confirm_button.is_visible():
                 logger.warning("Delete confirmation button not found.")
                 break
 
             try:
                 confirm_button.click()
-                item.wait_for(state="detached", timeout=2000)
             except Exception as e:
-                logger.warning(f"Generated item did not delete cleanly: {e}")
+                logger.warning("Generated item did not delete cleanly: %s", e)
+            else:
+                # `item` is nth=0 and re-matches the next item, so pace the
+                # loop on the child count dropping instead
+                if not self._wait_for_item_count_change(count, timeout=3000):
+                    logger.warning("Generated item did not delete cleanly")
 
             removed += 1
-            self.page.wait_for_timeout(300)
 
         return {"success": removed > 0, "count": removed}
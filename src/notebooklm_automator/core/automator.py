@@ -1,6 +1,8 @@
 """Main automator class for Google NotebookLM."""
 
+import functools
 import logging
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 
 from playwright.sync_api import sync_playwright, Error as PlaywrightError
@@ -25,6 +27,17 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _serialized(method):
+    """Run an automator method while holding the instance's page lock."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class NotebookLMAutomator:
     """
     Automator for Google NotebookLM.
@@ -51,7 +64,12 @@ class NotebookLMAutomator:
         self._source_manager: Optional[SourceManager] = None
         self._audio_manager: Optional[AudioManager] = None
         self._video_manager: Optional[VideoManager] = None
+        # All managers drive the same page and the sync Playwright API is not
+        # safe for concurrent use, so public operations run one at a time.
+        # Reentrant because operations call ensure_connected() internally.
+        self._lock = threading.RLock()
 
+    @_serialized
     def connect(self) -> None:
         """Connect to the browser and navigate to the notebook."""
         if self.page and not self.page.is_closed():
@@ -157,6 +175,7 @@ class NotebookLMAutomator:
             self.close()
             raise
 
+    @_serialized
     def ensure_connected(self) -> None:
         """Ensure the automation is connected to the browser."""
         try:
@@ -168,6 +187,7 @@ class NotebookLMAutomator:
             logger.info("Connection lost, reconnecting...")
             self.connect()
 
+    @_serialized
     def save_login_state(self, path: Optional[str] = None) -> bool:
         """
         Save current browser login state to storage_state.json.
@@ -193,6 +213,7 @@ class NotebookLMAutomator:
             logger.error(f"Failed to save login state: {e}")
             return False
 
+    @_serialized
     def close(self) -> None:
         """Close the connection and clean up resources."""
         try:
@@ -308,9 +329,10 @@ class NotebookLMAutomator:
     def _init_managers(self) -> None:
         """Initialize source and audio managers after page is ready."""
         self._source_manager = SourceManager(self.page, self._get_text)
-        self._audio_manager = AudioManager(self.page, self._get_text)
-        self._video_manager = VideoManager(self.page, self._get_text)
+        self._audio_manager = AudioManager(self.page, self.lang)
+        self._video_manager = VideoManager(self.page, self.lang)
 
+    @_serialized
     def add_sources(self, sources: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """
         Add sources to the notebook.
@@ -322,8 +344,13 @@ class NotebookLMAutomator:
             List of results for each source.
         """
         self.ensure_connected()
-        return self._source_manager.add_sources(sources)
+        try:
+            return self._source_manager.add_sources(sources)
+        finally:
+            # SourceManager switches to the Sources tab in tab layout
+            self.invalidate_studio_tab()
 
+    @_serialized
     def clear_sources(self) -> Dict[str, Any]:
         """
         Clear all sources from the notebook.
@@ -332,8 +359,22 @@ class NotebookLMAutomator:
             Dict with 'success' and 'count' keys.
         """
         self.ensure_connected()
-        return self._source_manager.clear_sources()
+        try:
+            return self._source_manager.clear_sources()
+        finally:
+            self.invalidate_studio_tab()
+
+    def invalidate_studio_tab(self) -> None:
+        """Make the Studio managers re-check the active tab on next use.
+
+        Call after anything that may leave the Studio panel: source
+        operations (Sources tab) or a page reload.
+        """
+        for manager in (self._audio_manager, self._video_manager):
+            if manager is not None:
+                manager.invalidate_studio_tab()
 
+    @_serialized
     def generate_audio(
         self,
         style: Optional[str] = None,
@@ -356,6 +397,7 @@ class NotebookLMAutomator:
         self.ensure_connected()
         return self._audio_manager.generate(style, prompt, language, duration)
 
+    @_serialized
     def get_audio_status(self, job_id: str) -> Dict[str, str]:
         """
         Check the status of an audio generation job.
@@ -369,6 +411,7 @@ class NotebookLMAutomator:
         self.ensure_connected()
         return self._audio_manager.get_status(job_id)
 
+    @_serialized
     def get_download_url(self, job_id: str) -> Optional[str]:
         """
         Get the direct download URL for generated audio.
@@ -382,7 +425,22 @@ class NotebookLMAutomator:
         self.ensure_connected()
         return self._audio_manager.get_download_url(job_id)
 
-    def download_audio_file(self, job_id: str) -> Optional[Tuple[bytes, str, int]]:
+    @_serialized
+    def fetch_audio(self, url: str) -> Optional[bytes]:
+        """
+        Fetch audio from a captured media URL using the browser's cookies.
+
+        Args:
+            url: The URL returned from get_download_url.
+
+        Returns:
+            Audio bytes or None if the request failed.
+        """
+        self.ensure_connected()
+        return self._audio_manager.fetch_media(url)
+
+    @_serialized
+    def download_audio_file(self, job_id: str) -> Optional[Tuple[str, str, int]]:
         """
         Download the audio file by clicking Download in the UI.
 
@@ -390,11 +448,13 @@ class NotebookLMAutomator:
             job_id: The job ID of the audio to download.
 
         Returns:
-            Tuple of (file_content, file_name, file_size) or None if failed.
+            Tuple of (file_path, file_name, file_size) or None if failed.
+            The caller owns the file at file_path and should delete it.
         """
         self.ensure_connected()
         return self._audio_manager.download_file(job_id)
 
+    @_serialized
     def clear_studio(self) -> Dict[str, Any]:
         """
         Delete all generated audio items.
@@ -406,6 +466,7 @@ class NotebookLMAutomator:
         self._source_manager.close_dialog()
         return self._audio_manager.clear_studio()
 
+    @_serialized
     def generate_video(
         self,
         language: Optional[str] = None,
@@ -423,6 +484,7 @@ class NotebookLMAutomator:
         self.ensure_connected()
         return self._video_manager.generate(language=language, prompt=prompt)
 
+    @_serialized
     def get_video_status(self, job_id: str) -> Dict[str, str]:
         """Check the status of a video generation job.
 
@@ -435,14 +497,18 @@ class NotebookLMAutomator:
         self.ensure_connected()
         return self._video_manager.get_status(job_id)
 
-    def download_video_file(self, job_id: str) -> Optional[Tuple[bytes, str, int]]:
+    @_serialized
+    def download_video_file(self, job_id: str) -> Optional[Tuple[str, str, int]]:
         """Download the video file by clicking Download in the UI.
 
+        The file is saved under DOWNLOAD_DIR (default: /tmp/shared-downloads);
+        the caller is responsible for deleting it once consumed.
+
         Args:
             job_id: The job ID of the video to download.
 
         Returns:
-            Tuple of (file_content, file_name, file_size) or None if failed.
+            Tuple of (file_path, file_name, file_size) or None if failed.
         """
         self.ensure_connected()
         return self._video_manager.download_file(job_id)
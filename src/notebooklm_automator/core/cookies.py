@@ -1,10 +1,13 @@
 """Cookie and storage state utilities for NotebookLM Automator."""
 
+import csv
+import functools
 import json
 import logging
 import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +17,17 @@ STORAGE_STATE_FILE = "storage_state.json"
 # CookieCloud JSON file name
 COOKIECLOUD_FILE = "cookie.json"
 
+# Google-related cookie domains (all google.* hosts, static assets, APIs, YouTube)
+_GOOGLE_DOMAIN_RE = re.compile(r"google\.|gstatic\.com|googleapis\.com|youtube\.com")
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Stat a path once, returning None if it does not exist or is unreadable."""
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
 
 def parse_cookies_txt(file_path: str) -> List[Dict[str, Any]]:
     """
@@ -27,37 +41,41 @@ def parse_cookies_txt(file_path: str) -> List[Dict[str, Any]]:
 
     Netscape cookies.txt format (tab-separated):
         domain, include_subdomains, path, secure, expiration, name, value
+
+    Parsed results are cached per (path, mtime), so repeated calls only
+    re-read the file after it changes. Each call returns fresh dicts.
     """
-    cookies = []
     path = Path(file_path)
+    stat = _stat_or_none(path)
 
-    if not path.exists():
+    if stat is None:
         logger.warning(f"Cookies file not found: {file_path}")
         return []
 
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
+    cookies = _parse_cookies_txt(str(path), stat.st_mtime_ns)
+    return [dict(cookie) for cookie in cookies]
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_cookies_txt(file_path: str, mtime_ns: int) -> Tuple[Dict[str, Any], ...]:
+    """Parse a cookies.txt file; mtime_ns is only part of the cache key."""
+    cookies = []
 
-                parts = line.split("\t")
-                if len(parts) < 7:
+    try:
+        with open(file_path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE):
+                # Skip empty lines, comments and malformed rows
+                if not row or row[0].startswith("#") or len(row) < 7:
                     continue
 
-                domain, _flag, cookie_path, secure, expiration, name, value = parts[:7]
+                domain, _flag, cookie_path, secure, expiration, name, value = row[:7]
+                # csv keeps trailing spaces and a CRLF file's "\r" on the last field
+                name = name.strip()
+                value = value.strip()
 
                 # Only include Google-related cookies
                 # Include all google.com subdomains (accounts, notebooklm, etc.)
-                if not (
-                    "google.com" in domain
-                    or "google." in domain
-                    or "gstatic.com" in domain
-                    or "googleapis.com" in domain
-                    or "youtube.com" in domain
-                ):
+                if not _GOOGLE_DOMAIN_RE.search(domain):
                     continue
 
                 cookie = {
@@ -80,11 +98,11 @@ def parse_cookies_txt(file_path: str) -> List[Dict[str, Any]]:
                 cookies.append(cookie)
 
         logger.info(f"Parsed {len(cookies)} cookies from {file_path}")
-        return cookies
+        return tuple(cookies)
 
     except Exception as e:
         logger.warning(f"Failed to parse cookies file: {e}")
-        return []
+        return ()
 
 
 def has_chrome_login_state() -> bool:
@@ -221,13 +239,7 @@ def parse_cookiecloud_json(file_path: str) -> List[Dict[str, Any]]:
                 domain = cc_cookie.get("domain", "")
 
                 # Only include Google-related cookies
-                if not (
-                    "google.com" in domain
-                    or "google." in domain
-                    or "gstatic.com" in domain
-                    or "googleapis.com" in domain
-                    or "youtube.com" in domain
-                ):
+                if not _GOOGLE_DOMAIN_RE.search(domain):
                     continue
 
                 # Convert to Playwright format
@@ -43,7 +43,7 @@ class SourceManager:
         source_items = self.page.locator("div.single-source-container")
         add_btn = self.page.get_by_text(self._get_text("add_source_button"), exact=False).first
 
-        if source_items.count() > 0 or (add_btn.count() > 0 and add_btn.is_visible()):
+        if source_items.count() > 0 or add_btn.is_visible():
             return  # Already in full layout or Sources tab
 
         # Close any open dialog that might block tab clicks
@@ -57,7 +57,7 @@ class SourceManager:
             f".mat-tab-label:has-text('{sources_text}'), "
             f"[role='tab']:has-text('{sources_text}')"
         ).first
-        if sources_tab.count() > 0 and sources_tab.is_visible():
+        if sources_tab.is_visible():
             logger.info("Switching to Sources tab...")
             sources_tab.click()
             self.page.wait_for_timeout(500)
@@ -65,7 +65,7 @@ class SourceManager:
 
         # Priority 2: fallback to text matching
         sources_tab = self.page.get_by_text(sources_text, exact=True).first
-        if sources_tab.count() > 0 and sources_tab.is_visible():
+        if sources_tab.is_visible():
             logger.info("Switching to Sources tab (text match)...")
             sources_tab.click()
             self.page.wait_for_timeout(500)
@@ -86,7 +86,7 @@ class SourceManager:
         add_button = self.page.locator(
             f"button:has-text('{self._get_text('add_source_button')}')"
         ).first
-        if add_button.count() == 0 or not add_button.is_visible():
+        if not add_button.is_visible():
             raise RuntimeError("Could not locate the 'Add source' button")
 
         add_button.click()
@@ -100,13 +100,13 @@ class SourceManager:
         close_button = self.page.locator(
             "button:has(mat-icon:has-text('close'))"
         ).first
-        if close_button.count() > 0 and close_button.is_visible():
+        if close_button.is_visible():
             close_button.click()
             self.page.wait_for_timeout(200)
             return
 
         close_icon = self.page.locator("mat-icon", has_text="close").first
-        if close_icon.count() > 0 and close_icon.is_visible():
+        if close_icon.is_visible():
             close_icon.click()
             self.page.wait_for_timeout(200)
 
@@ -122,25 +122,25 @@ class SourceManager:
                     "mat-chip-option, .mdc-evolution-chip, span.mat-mdc-chip-action",
                     has_text=type_text
                 ).first
-                if chip.count() > 0 and chip.is_visible():
+                if chip.is_visible():
                     chip.click()
                 else:
                     chip = self.page.get_by_text(type_text, exact=True).first
-                    if chip.count() > 0 and chip.is_visible():
+                    if chip.is_visible():
                         chip.click()
 
             inp = self.page.locator("textarea[formcontrolname='newUrl']").first
-            if inp.count() == 0 or not inp.is_visible():
+            if not inp.is_visible():
                 inp = self.page.locator(
                     "input[type='url'], input[placeholder*='http'], textarea[placeholder*='http']"
                 ).first
 
-            if inp.count() == 0 or not inp.is_visible():
+            if not inp.is_visible():
                 placeholder = self._get_text("url_input_placeholder")
                 if placeholder:
                     inp = self.page.get_by_placeholder(placeholder, exact=False).first
 
-            if inp.count() == 0 or not inp.is_visible():
+            if not inp.is_visible():
                 raise RuntimeError(f"Could not find URL input field for {source_type}")
 
             inp.fill(url)
@@ -149,7 +149,7 @@ class SourceManager:
             insert_text = self._get_text("insert_button")
             insert_btn = self.page.get_by_role("button", name=insert_text).first
 
-            if insert_btn.count() > 0 and insert_btn.is_visible():
+            if insert_btn.is_visible():
                 insert_btn.click()
             else:
                 inp.press("Enter")
@@ -169,13 +169,13 @@ class SourceManager:
                     "mat-chip-option, .mdc-evolution-chip, span.mat-mdc-chip-action",
                     has_text=type_text
                 ).first
-                if chip.count() == 0 or not chip.is_visible():
+                if not chip.is_visible():
                     chip = self.page.get_by_text(type_text, exact=True).first
-            if chip and chip.count() > 0 and chip.is_visible():
+            if chip and chip.is_visible():
                 chip.click()
 
             dialog = self.page.locator("mat-dialog-container").last
-            if not dialog or dialog.count() == 0 or not dialog.is_visible():
+            if not dialog or not dialog.is_visible():
                 dialog = self.page
 
             textarea = dialog.locator(
@@ -184,7 +184,7 @@ class SourceManager:
                 "textarea"
             ).first
 
-            if textarea.count() == 0 or not textarea.is_visible():
+            if not textarea.is_visible():
                 raise RuntimeError(
                     "Could not find text input field for copied text source"
                 )
@@ -195,7 +195,7 @@ class SourceManager:
             insert_text = self._get_text("insert_button")
             insert_btn = self.page.get_by_role("button", name=insert_text).first
 
-            if insert_btn.count() > 0 and insert_btn.is_visible():
+            if insert_btn.is_visible():
                 insert_btn.click()
             else:
                 textarea.press("Enter")
@@ -252,12 +252,12 @@ class SourceManager:
             source = source_items.first
             try:
                 more_button = source.locator("button.source-item-more-button").first
-                if more_button.count() == 0 or not more_button.is_visible():
+                if not more_button.is_visible():
                     more_button = source.locator(
                         "button:has(mat-icon:has-text('more_vert'))"
                     ).first
 
-                if more_button.count() == 0 or not more_button.is_visible():
+                if not more_button.is_visible():
                     logger.warning("Could not locate 'more' button for a source item.")
                     break
 
@@ -266,7 +266,7 @@ class SourceManager:
 
                 delete_text = self._get_text("delete_source_menu_item")
                 menu_item = self.page.get_by_role("menuitem", name=delete_text).first
-                if menu_item.count() > 0 and menu_item.is_visible():
+                if menu_item.is_visible():
                     menu_item.click()
                 else:
                     logger.warning("Could not find 'Remove source' menu item.")
@@ -277,7 +277,7 @@ class SourceManager:
                 confirm_button = self.page.get_by_role(
                     "button", name=confirm_text
                 ).first
-                if confirm_button.count() > 0 and confirm_button.is_visible():
+                if confirm_button.is_visible():
                     confirm_button.click()
                 else:
                     logger.warning(
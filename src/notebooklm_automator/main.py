@@ -1,7 +1,8 @@
 import uvicorn
 import os
 import argparse
-from dotenv import load_dotenv
+
+from notebooklm_automator.config import get_settings
 
 def main():
     parser = argparse.ArgumentParser(description="Start the NotebookLM Automator API server.")
@@ -10,12 +11,13 @@ def main():
     parser.add_argument("--notebook-url", type=str, help="NotebookLM Notebook URL (overrides NOTEBOOKLM_URL env var)")
     parser.add_argument("--headless", action="store_true", help="Run Chrome in headless mode (no GUI)")
     parser.add_argument("--cookies-file", type=str, help="Path to cookies.txt file for auto-login (Netscape format)")
+    parser.add_argument("--reload", action="store_true", help="Restart the server on code changes (development only)")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes (each drives its own browser session)")
+    parser.add_argument("--loop", type=str, default="auto", choices=["auto", "asyncio", "uvloop"], help="Event loop implementation (auto uses uvloop when installed)")
+    parser.add_argument("--http", type=str, default="auto", choices=["auto", "h11", "httptools"], help="HTTP protocol implementation (auto uses httptools when installed)")
 
     args = parser.parse_args()
 
-    # Load .env file if exists
-    load_dotenv()
-
     if args.notebook_url:
         os.environ["NOTEBOOKLM_URL"] = args.notebook_url
 
@@ -25,14 +27,31 @@ def main():
     if args.cookies_file:
         os.environ["NOTEBOOKLM_COOKIES_FILE"] = args.cookies_file
 
-    if not os.getenv("NOTEBOOKLM_URL"):
-        print("Error: NOTEBOOKLM_URL environment variable or argument is required.")
-        return
+    # Loads .env without overriding the CLI values set above
+    settings = get_settings()
 
-    headless_mode = "headless" if args.headless else "GUI"
-    print(f"Starting API server for notebook: {os.getenv('NOTEBOOKLM_URL')} ({headless_mode} mode)")
+    if not settings.notebook_url:
+        print("Error: NOTEBOOKLM_URL environment variable or argument is required.", flush=True)
+        return
 
-    uvicorn.run("notebooklm_automator.api.app:app", host=args.host, port=args.port, reload=True)
+    headless_mode = "headless" if settings.headless else "GUI"
+    print(f"Starting API server for notebook: {settings.notebook_url} ({headless_mode} mode)", flush=True)
+
+    if args.workers > 1:
+        if args.reload:
+            print("Warning: --reload ignores --workers; starting a single process.", flush=True)
+        else:
+            print(f"Warning: {args.workers} workers each open their own browser session; requests are not coordinated across them.", flush=True)
+
+    uvicorn.run(
+        "notebooklm_automator.api.app:app",
+        host=args.host,
+        port=args.port,
+        reload=args.reload,
+        workers=args.workers,
+        loop=args.loop,
+        http=args.http,
+    )
 
 if __name__ == "__main__":
     main()